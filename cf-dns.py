@@ -1,22 +1,68 @@
 #!/usr/bin/env python3
 """
 Cloudflare DNS CLI (stdlib only)
-- zones / list / add / update / delete DNS records
+- zones / list / add / update / delete DNS records (add-batch / delete-batch in bulk)
 - token from env CF_API_TOKEN (default) or --token-file
 - add/update/delete ask for confirmation (skip with --yes)
 """
 
 import argparse
+import base64
+import email.utils
+import functools
+import hashlib
+import http.client
 import json
 import os
+import select
 import sys
+import tempfile
+import threading
+import time
 import urllib.parse
 import urllib.request
+import zlib
+
+try:
+    import orjson  # optional, faster (de)serialisation of API traffic
+except ImportError:
+    orjson = None
 
 __version__ = "1.2.0"
 
 API_BASE = "https://api.cloudflare.com/client/v4"
 
+# Idle keep-alive connections per (scheme, host, port).
+_POOL = {}
+_POOL_LOCK = threading.Lock()
+_POOL_MAXSIZE = 16
+# Transient statuses retried with backoff, for idempotent methods only.
+RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+RETRY_METHODS = frozenset(("GET", "HEAD", "PUT", "DELETE"))
+RETRY_TOTAL = 3
+RETRY_BACKOFF = 0.3
+RETRY_AFTER_MAX = 30
+# Concurrent page fetches once total_pages is known; kept low for CF rate limits.
+_PAGE_WORKERS = 8
+# DNS record listings accept large pages; 10x fewer round-trips than the default 100.
+RECORDS_PER_PAGE = 1000
+
+# On-disk cache under $XDG_CACHE_HOME/cf-dns; see README for the layout.
+CACHE_ENABLED = True
+ZONE_TTL = 24 * 3600
+NEGATIVE_TTL = 60
+ETAG_TTL = 7 * 24 * 3600
+ETAG_MAX_ENTRIES = 32
+_CACHE = {}
+_CACHE_LOCK = threading.Lock()
+_ZONES_FROM_CACHE = set()
+
+if orjson:
+    _json_loads, _json_dumps = orjson.loads, orjson.dumps
+else:
+    _json_loads = json.loads
+    def _json_dumps(obj): return json.dumps(obj).encode("utf-8")
+
 def die(msg, code=1, data=None):
     print(msg, file=sys.stderr)
     if data is not None:
@@ -35,70 +81,347 @@ def read_token(token_file):
             die(f"Error reading token file: {e}", 2)
     die("No token. Set CF_API_TOKEN or use --token-file /path/to/token.txt", 2)
 
+@functools.lru_cache(maxsize=4)
 def headers(token):
+    # Built once per token and shared by every request; treat as read-only.
     return {
         "Authorization": f"Bearer {token}",
         "Content-Type": "application/json",
         "Accept": "application/json",
+        "Accept-Encoding": "gzip, deflate",
         "User-Agent": f"cf-dns-cli-stdlib/{__version__}",
     }
 
-def http_json(method, url, token, payload=None, params=None):
+def cache_dir():
+    root = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(root, "cf-dns")
+
+def _cache_load(name):
+    if name not in _CACHE:
+        try:
+            with open(os.path.join(cache_dir(), name), "rb") as f:
+                data = _json_loads(f.read())
+        except (OSError, ValueError):
+            data = {}
+        _CACHE[name] = data if isinstance(data, dict) else {}
+    return _CACHE[name]
+
+def _cache_prune(name):
+    data = _CACHE[name]
+    now = time.time()
+    for k in [k for k, v in data.items() if not isinstance(v, dict) or v.get("expires", 0) <= now]:
+        del data[k]
+
+def _write_atomic(d, name, data):
+    # Best effort: an unwritable cache dir must never break a command.
+    tmp = None
+    try:
+        os.makedirs(d, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=d, prefix=f".{name}.")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, os.path.join(d, name))
+        return True
+    except OSError:
+        if tmp:
+            try: os.unlink(tmp)
+            except OSError: pass
+        return False
+
+def _cache_save(name):
+    _cache_prune(name)
+    _write_atomic(cache_dir(), name, _json_dumps(_CACHE[name]))
+
+def cache_get(name, key):
+    if not CACHE_ENABLED: return None
+    with _CACHE_LOCK:
+        data = _cache_load(name)
+        ent = data.get(key)
+        if ent is None: return None
+        if not isinstance(ent, dict) or ent.get("expires", 0) <= time.time():
+            del data[key]
+            return None
+        return ent
+
+def cache_put(name, key, ttl, **fields):
+    if not CACHE_ENABLED: return
+    with _CACHE_LOCK:
+        _cache_load(name)[key] = dict(fields, expires=int(time.time() + ttl))
+        _cache_save(name)
+
+def cache_drop(name, keys):
+    if not CACHE_ENABLED: return
+    with _CACHE_LOCK:
+        data = _cache_load(name)
+        dropped = [k for k in keys if data.pop(k, None) is not None]
+        if dropped: _cache_save(name)
+
+# Listing pages kept for If-None-Match: one file per URL and token, holding the
+# ETag line and the raw body. The file's mtime is its last use.
+def _etag_path(token, url):
+    key = hashlib.sha256(cache_scope(token, url).encode("utf-8")).hexdigest()
+    return os.path.join(cache_dir(), "etags", key)
+
+def etag_get(path):
+    try:
+        if os.stat(path).st_mtime + ETAG_TTL <= time.time(): return None
+        with open(path, "rb") as f:
+            etag, _, body = f.read().partition(b"\n")
+    except OSError:
+        return None
+    return (etag.decode("latin-1"), body) if etag and body else None
+
+def etag_touch(path):
+    try: os.utime(path)
+    except OSError: pass
+
+def etag_put(path, etag, body):
+    d, name = os.path.split(path)
+    if not _write_atomic(d, name, etag.encode("latin-1") + b"\n" + body): return
+    now = time.time()
+    try:
+        with os.scandir(d) as it:
+            ents = sorted(((e.stat().st_mtime, e.path) for e in it if not e.name.startswith(".")), reverse=True)
+    except OSError:
+        return
+    for i, (mtime, p) in enumerate(ents):
+        if i >= ETAG_MAX_ENTRIES or mtime + ETAG_TTL <= now:
+            try: os.unlink(p)
+            except OSError: pass
+
+def _connect(scheme, host, port):
+    cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+    proxy = urllib.request.getproxies().get(scheme)
+    if not proxy or urllib.request.proxy_bypass(host):
+        return cls(host, port, timeout=30)
+    p = urllib.parse.urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+    tunnel_headers = {}
+    if p.username:
+        cred = f"{urllib.parse.unquote(p.username)}:{urllib.parse.unquote(p.password or '')}"
+        tunnel_headers["Proxy-Authorization"] = "Basic " + base64.b64encode(cred.encode("utf-8")).decode("ascii")
+    conn = cls(p.hostname, p.port, timeout=30)
+    conn.set_tunnel(host, port, headers=tunnel_headers)
+    return conn
+
+def _is_stale(conn):
+    # An idle keep-alive socket that is readable has been closed by the peer.
+    if conn.sock is None: return True
+    try: return bool(select.select([conn.sock], [], [], 0)[0])
+    except (OSError, ValueError): return True
+
+def _acquire(key):
+    while True:
+        with _POOL_LOCK:
+            idle = _POOL.get(key)
+            conn = idle.pop() if idle else None
+        if conn is None: return _connect(*key), False
+        if not _is_stale(conn): return conn, True
+        conn.close()
+
+def _release(key, conn):
+    with _POOL_LOCK:
+        idle = _POOL.setdefault(key, [])
+        if len(idle) < _POOL_MAXSIZE:
+            idle.append(conn); return
+    conn.close()
+
+def _decompress(body, encoding):
+    encoding = (encoding or "").strip().lower()
+    if encoding in ("gzip", "x-gzip"):
+        return zlib.decompress(body, 16 + zlib.MAX_WBITS)
+    if encoding == "deflate":
+        # Servers disagree on zlib-wrapped vs raw deflate; accept both.
+        try: return zlib.decompress(body)
+        except zlib.error: return zlib.decompress(body, -zlib.MAX_WBITS)
+    return body
+
+def _retry_delay(attempt, retry_after):
+    if retry_after:
+        try: return min(max(float(retry_after), 0), RETRY_AFTER_MAX)
+        except ValueError: pass
+        try:
+            when = email.utils.parsedate_to_datetime(retry_after).timestamp()
+            return min(max(when - time.time(), 0), RETRY_AFTER_MAX)
+        except (TypeError, ValueError): pass
+    return RETRY_BACKOFF * (2 ** attempt)
+
+def http_request(method, url, token, data=None, extra_headers=None):
+    """Send one request over a pooled connection; returns (status, body, headers)."""
+    hdrs = {**headers(token), **extra_headers} if extra_headers else headers(token)
+    u = urllib.parse.urlsplit(url)
+    key = (u.scheme, u.hostname, u.port)
+    path = (u.path or "/") + (f"?{u.query}" if u.query else "")
+    attempt = 0
+    while True:
+        conn, reused = _acquire(key)
+        try:
+            conn.request(method, path, body=data, headers=hdrs)
+        except ConnectionError:
+            conn.close()
+            # Sending on a dropped keep-alive socket; nothing was processed.
+            if reused: continue
+            raise
+        except BaseException:
+            conn.close()
+            raise
+        try:
+            resp = conn.getresponse()
+            body = resp.read()
+        except (ConnectionError, http.client.BadStatusLine):
+            conn.close()
+            # The request may already have been applied; only replay reads.
+            if reused and method in ("GET", "HEAD"): continue
+            raise
+        except BaseException:
+            conn.close()
+            raise
+        if resp.will_close: conn.close()
+        else: _release(key, conn)
+        if resp.status in RETRY_STATUSES and method in RETRY_METHODS and attempt < RETRY_TOTAL:
+            time.sleep(_retry_delay(attempt, resp.getheader("Retry-After")))
+            attempt += 1
+            continue
+        if body and resp.status not in (204, 304):
+            body = _decompress(body, resp.getheader("Content-Encoding"))
+        return resp.status, body, resp.headers
+
+def http_json(method, url, token, payload=None, params=None, strict=True, conditional=False):
+    """Call the API and return the parsed JSON; dies on error (strict=False: None on 400)."""
     if params:
         q = urllib.parse.urlencode(params)
         url = f"{url}?{q}"
     data = None
     if payload is not None:
-        data = json.dumps(payload).encode("utf-8")
-    req = urllib.request.Request(url, data=data, method=method, headers=headers(token))
+        data = _json_dumps(payload)
+    etag_path = _etag_path(token, url) if conditional and CACHE_ENABLED else None
+    seen = etag_get(etag_path) if etag_path else None
+    extra = {"If-None-Match": seen[0]} if seen else None
     try:
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            body = resp.read().decode("utf-8", "replace")
-            js = json.loads(body)
-            if not js.get("success", False):
-                die(f"Cloudflare API error (HTTP {resp.status})", data=js)
-            return js
-    except urllib.error.HTTPError as e:
-        body = e.read().decode("utf-8", "replace")
-        try: js = json.loads(body)
-        except Exception: die(f"HTTP {e.code}: {body[:4000]}")
-        die(f"Cloudflare API error (HTTP {e.code})", data=js)
-    except urllib.error.URLError as e:
+        status, body, resp_headers = http_request(method, url, token, data, extra)
+    except (OSError, http.client.HTTPException, zlib.error) as e:
         die(f"Network error: {e}")
+    if status == 304 and seen:
+        etag_touch(etag_path)
+        return _json_loads(seen[1])
+    if status == 400 and not strict:
+        return None
+    if not 200 <= status < 300:
+        # The token can no longer reach a cached zone id; look it up again next time.
+        if status in (401, 403) and _ZONES_FROM_CACHE:
+            cache_drop("zones.json", _ZONES_FROM_CACHE)
+        try: js = _json_loads(body)
+        except Exception: die(f"HTTP {status}: {body[:4000].decode('utf-8', 'replace')}")
+        die(f"Cloudflare API error (HTTP {status})", data=js)
+    # Both parsers take bytes directly; no intermediate str copy.
+    js = _json_loads(body)
+    if not js.get("success", False):
+        die(f"Cloudflare API error (HTTP {status})", data=js)
+    etag = resp_headers.get("ETag") if etag_path else None
+    if etag:
+        etag_put(etag_path, etag, body)
+    return js
+
+def cache_scope(token, base):
+    """Prefix for cache keys: entries only hold for the base URL and token that made them."""
+    return f"{base.rstrip('/')}|{hashlib.sha256(token.encode('utf-8')).hexdigest()[:16]}"
+
+def _negative_key(token, base, zid, rtype, fqdn):
+    return f"{cache_scope(token, base)}|" + f"{zid}|{rtype}|{fqdn}".lower()
 
 def zone_id(token, zone_name, base=API_BASE):
+    key = f"{cache_scope(token, base)}|{zone_name.lower()}"
+    neg = f"zone|{key}"
+    ent = cache_get("zones.json", key)
+    if ent and ent.get("id"):
+        _ZONES_FROM_CACHE.add(key)
+        return ent["id"]
+    if cache_get("negative.json", neg):
+        die(f"Zone not found or unauthorized: {zone_name} (cached, retry with --no-cache)", 3)
     js = http_json("GET", f"{base}/zones", token, params={"name": zone_name})
     res = js.get("result") or []
-    if not res: die(f"Zone not found or unauthorized: {zone_name}", 3)
+    if not res:
+        cache_put("negative.json", neg, NEGATIVE_TTL)
+        die(f"Zone not found or unauthorized: {zone_name}", 3)
+    cache_put("zones.json", key, ZONE_TTL, id=res[0]["id"])
     return res[0]["id"]
 
-def paginate_records(token, zid, rtype=None, base=API_BASE):
-    page, per = 1, 100
-    out = []
-    while True:
-        params = {"page": page, "per_page": per}
-        if rtype: params["type"] = rtype
-        js = http_json("GET", f"{base}/zones/{zid}/dns_records", token, params=params)
-        out.extend(js.get("result") or [])
-        info = js.get("result_info") or {}
-        if page >= int(info.get("total_pages", 1)): break
-        page += 1
+def resolve_zone(token, zone_name, zid=None, base=API_BASE):
+    """An explicit --zone-id wins over the lookup and is never cached."""
+    return zid or zone_id(token, zone_name, base)
+
+def paginate(token, url, params=None, per=100, strict=True):
+    """Fetch all pages of a list endpoint: page 1, then the cursor chain or pages 2..N in parallel."""
+    def fetch(page, strict=True, cursor=None):
+        pos = {"cursor": cursor} if cursor else {"page": page}
+        # Cursor URLs are single-use, so there is nothing to revalidate later.
+        return http_json("GET", url, token, params={**(params or {}), **pos, "per_page": per},
+                         strict=strict, conditional=cursor is None)
+    js = fetch(1, strict)
+    if js is None: return None
+    out = list(js.get("result") or [])
+    info = js.get("result_info") or {}
+    total = int(info.get("total_pages", 1))
+    after = (info.get("cursors") or {}).get("after")
+    if after:
+        # Each cursor page names the next one, so these are fetched in order.
+        while after:
+            js = fetch(None, cursor=after)
+            out.extend(js.get("result") or [])
+            after = ((js.get("result_info") or {}).get("cursors") or {}).get("after")
+    elif total > 1:
+        import concurrent.futures  # deferred: ~10ms at import, only needed for multi-page listings
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(_PAGE_WORKERS, total - 1)) as ex:
+            for js in ex.map(fetch, range(2, total + 1)):
+                out.extend(js.get("result") or [])
     return out
 
+def paginate_records(token, zid, rtype=None, base=API_BASE, strict=True, **extra_params):
+    params = dict(extra_params)
+    if rtype: params["type"] = rtype
+    return paginate(token, f"{base}/zones/{zid}/dns_records", params, per=RECORDS_PER_PAGE, strict=strict)
+
+RECORD_COLUMNS = ("id", "type", "name", "content", "ttl", "proxied")
+
 def render_table(records):
-    print("id\ttype\tname\tcontent\tttl\tproxied")
-    for r in records:
-        print(f"{r.get('id','')}\t{r.get('type','')}\t{r.get('name','')}\t{r.get('content','')}\t{r.get('ttl','')}\t{r.get('proxied','')}")
+    lines = ["\t".join(RECORD_COLUMNS)]
+    lines += ["\t".join([str(r.get(c, "")) for c in RECORD_COLUMNS]) for r in records]
+    sys.stdout.write("\n".join(lines) + "\n")
+
+def write_json(obj):
+    """Pretty-print obj as JSON on stdout (2-space indent, trailing newline)."""
+    if orjson:
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+    else:
+        sys.stdout.write(json.dumps(obj, indent=2) + "\n")
+
+_ZONE_SUFFIXES = {}
 
 def normalize_name(zone, name):
-    return name if (name == zone or name.endswith("." + zone)) else f"{name}.{zone}"
+    try: suffix = _ZONE_SUFFIXES[zone]
+    except KeyError: suffix = _ZONE_SUFFIXES[zone] = "." + zone
+    return name if (name == zone or name.endswith(suffix)) else f"{name}.{zone}"
+
+# Record types that can be orange-clouded (proxied) by Cloudflare.
+PROXIABLE_TYPES = frozenset(("A", "AAAA", "CNAME"))
 
 def build_payload(name, rtype, content, ttl=None, proxied=None):
     p = {"type": rtype, "name": name, "content": content}
     if ttl is not None: p["ttl"] = int(ttl)
-    if rtype in ("A","AAAA","CNAME") and proxied is not None: p["proxied"] = bool(proxied)
+    if proxied is not None and rtype in PROXIABLE_TYPES: p["proxied"] = bool(proxied)
     return p
 
+PROMPT_TIMEOUT = 30
+
+def ask(prompt, timeout=PROMPT_TIMEOUT):
+    """input() that gives up after `timeout` seconds instead of blocking forever."""
+    sys.stdout.write(prompt); sys.stdout.flush()
+    ready, _, _ = select.select([sys.stdin], [], [], timeout)
+    if not ready:
+        print(file=sys.stderr)
+        die(f"No answer within {timeout}s, aborting.", 2)
+    return sys.stdin.readline().rstrip("\n")
+
 def find_record(token, zid, rid, name, rtype, zone_name, base=API_BASE):
     if rid:
         js = http_json("GET", f"{base}/zones/{zid}/dns_records/{rid}", token)
@@ -106,44 +429,52 @@ def find_record(token, zid, rid, name, rtype, zone_name, base=API_BASE):
     if not name or not rtype:
         die("Provide --id OR (--name and --type)", 2)
     fqdn = normalize_name(zone_name, name) if zone_name else name
+    neg = _negative_key(token, base, zid, rtype, fqdn)
+    if cache_get("negative.json", neg):
+        die(f"No records match: type={rtype} name={fqdn} (cached, retry with --no-cache)", 3)
     js = http_json("GET", f"{base}/zones/{zid}/dns_records", token,
                    params={"type": rtype, "name": fqdn})
     matches = js.get("result") or []
-    if not matches: die(f"No records match: type={rtype} name={fqdn}", 3)
+    if not matches:
+        cache_put("negative.json", neg, NEGATIVE_TTL)
+        die(f"No records match: type={rtype} name={fqdn}", 3)
     if len(matches) == 1:
         r = matches[0]; return r["id"], r
     if not sys.stdin.isatty():
         die(f"Multiple records match type={rtype} name={fqdn}. Use --id to specify.", 3)
     print("Multiple records found:\n")
     render_table(matches)
-    choice = input("\nEnter record ID to proceed (blank to cancel): ").strip()
+    choice = ask("\nEnter record ID to proceed (blank to cancel): ").strip()
     if not choice: print("No record selected.", file=sys.stderr); sys.exit(0)
     sel = next((m for m in matches if m.get("id")==choice), None)
     if not sel: die("Invalid record ID.", 2)
     return choice, sel
 
 def cmd_zones(token, base):
-    print("id\tname\tstatus\tplan")
-    page, per = 1, 50
-    while True:
-        js = http_json("GET", f"{base}/zones", token, params={"page": page, "per_page": per})
-        for z in js.get("result", []):
-            print(f"{z.get('id','')}\t{z.get('name','')}\t{z.get('status','')}\t{(z.get('plan') or {}).get('name','')}")
-        info = js.get("result_info") or {}
-        if page >= int(info.get("total_pages", 1)): break
-        page += 1
-
-def cmd_list(token, zone, rtype, name_substr, as_json, base):
-    zid = zone_id(token, zone, base)
-    recs = paginate_records(token, zid, rtype, base)
+    zones = paginate(token, f"{base}/zones", per=50)
+    lines = ["id\tname\tstatus\tplan"]
+    lines += [f"{z.get('id','')}\t{z.get('name','')}\t{z.get('status','')}\t{(z.get('plan') or {}).get('name','')}" for z in zones]
+    sys.stdout.write("\n".join(lines) + "\n")
+
+def cmd_list(token, zone, rtype, name_substr, as_json, base, zid=None):
+    zid = resolve_zone(token, zone, zid, base)
+    recs = None
     if name_substr:
+        # Let the API filter first; fall back to a full scan if it rejects name.contains.
+        recs = paginate_records(token, zid, rtype, base, strict=False, **{"name.contains": name_substr.lower()})
+    if recs is None:
+        recs = paginate_records(token, zid, rtype, base)
+    if name_substr:
+        # Plain case-insensitive substring match; names are always str from the API.
         needle = name_substr.lower()
-        recs = [r for r in recs if needle in str(r.get("name","")).lower()]
-    if as_json: print(json.dumps(recs, indent=2))
+        recs = [r for r in recs if needle in r["name"].lower()]
+    if as_json: write_json(recs)
     else: render_table(recs)
 
 def confirm(prompt, yes):
     if yes: return
+    if not sys.stdin.isatty():
+        die("Confirmation needed but stdin is not a terminal. Re-run with --yes.", 2)
     ans = input(f"{prompt} [y/N] ").strip().lower()
     if ans not in ("y","yes"):
         print("Aborted.", file=sys.stderr)
@@ -158,10 +489,11 @@ def cmd_add(token, zone, name, rtype, content, ttl, proxied, yes, base):
     confirm("Proceed?", yes)
     js = http_json("POST", f"{base}/zones/{zid}/dns_records", token, payload=payload)
     r = js["result"]
+    cache_drop("negative.json", [_negative_key(token, base, zid, rtype, fqdn)])
     print(f"Record {r.get('name')} ({r.get('type')}) created: {r.get('content')} (ttl={r.get('ttl')} proxied={r.get('proxied')})")
 
-def cmd_update(token, zone, rid, name, rtype, content, ttl, proxied, yes, base):
-    zid = zone_id(token, zone, base)
+def cmd_update(token, zone, rid, name, rtype, content, ttl, proxied, yes, base, zid=None):
+    zid = resolve_zone(token, zone, zid, base)
     rtype = rtype.upper() if rtype else None
     rid, current = find_record(token, zid, rid, name, rtype, zone, base)
     new_name = normalize_name(zone, name) if name else current.get("name")
@@ -176,10 +508,11 @@ def cmd_update(token, zone, rid, name, rtype, content, ttl, proxied, yes, base):
     confirm("Proceed?", yes)
     js = http_json("PUT", f"{base}/zones/{zid}/dns_records/{rid}", token, payload=payload)
     r = js["result"]
+    cache_drop("negative.json", [_negative_key(token, base, zid, new_type, new_name)])
     print(f"Record {r.get('name')} ({r.get('type')}) updated: {current.get('content')} → {r.get('content')}")
 
-def cmd_delete(token, zone, rid, name, rtype, yes, base):
-    zid = zone_id(token, zone, base)
+def cmd_delete(token, zone, rid, name, rtype, yes, base, zid=None):
+    zid = resolve_zone(token, zone, zid, base)
     rtype = rtype.upper() if rtype else None
     rid, current = find_record(token, zid, rid, name, rtype, zone, base)
     print(f"About to DELETE: {current.get('type')} {current.get('name')} → {current.get('content')}")
@@ -187,20 +520,108 @@ def cmd_delete(token, zone, rid, name, rtype, yes, base):
     http_json("DELETE", f"{base}/zones/{zid}/dns_records/{rid}", token)
     print(f"Record {current.get('name')} ({current.get('type')}) deleted: {current.get('content')}")
 
-def main():
-    ap = argparse.ArgumentParser(description="Cloudflare DNS CLI (stdlib only)", formatter_class=argparse.RawTextHelpFormatter)
-    ap.add_argument("--token-file", help="Read API token from file (first line). If omitted, uses CF_API_TOKEN.")
-    ap.add_argument("--base-url", default=API_BASE, help="Override API base URL.")
-    ap.add_argument("--yes", action="store_true", help="Skip confirmation prompts for add/update/delete.")
-    ap.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
-    sub = ap.add_subparsers(dest="cmd", required=True)
+ADD_BATCH_COLUMNS = ("name", "type", "content", "ttl", "proxied")
+DELETE_BATCH_COLUMNS = ("id",)
+
+def read_batch_rows(path, columns):
+    """Read batch rows ('-' = stdin) from a JSON array or TSV (positional `columns` or a header line)."""
+    try:
+        if path == "-": text = sys.stdin.read()
+        else:
+            with open(path, "r", encoding="utf-8") as f: text = f.read()
+    except OSError as e:
+        die(f"Error reading batch input: {e}", 2)
+    if text.lstrip().startswith("["):
+        try: rows = json.loads(text)
+        except ValueError as e: die(f"Invalid JSON batch input: {e}", 2)
+        if not all(isinstance(r, dict) for r in rows):
+            die("JSON batch input must be an array of objects.", 2)
+        return rows
+    lines = [l for l in text.splitlines() if l.strip() and not l.startswith("#")]
+    if lines and lines[0].split("\t")[0] in ("id", "name"):
+        columns = lines.pop(0).split("\t")
+    return [{k: v for k, v in zip(columns, l.split("\t")) if v != ""} for l in lines]
+
+def _is_text(value):
+    return isinstance(value, str) and value != ""
+
+def _parse_proxied(value, row):
+    if value is None or isinstance(value, bool): return value
+    v = str(value).strip().lower()
+    if v in ("on", "true", "yes", "1"): return True
+    if v in ("off", "false", "no", "0"): return False
+    die(f"Batch row {row}: invalid proxied value {value!r}", 2)
+
+def apply_batch(token, zid, ops, yes, base=API_BASE):
+    """POST posts/deletes to /dns_records/batch in one request (applied atomically)."""
+    n = sum(len(v) for v in ops.values())
+    confirm(f"About to apply {n} operations. Proceed?", yes)
+    js = http_json("POST", f"{base}/zones/{zid}/dns_records/batch", token, payload=ops)
+    return js.get("result") or {}
+
+def cmd_add_batch(token, zone, path, yes, base, zid=None):
+    posts = []
+    for i, row in enumerate(read_batch_rows(path, ADD_BATCH_COLUMNS), 1):
+        if not _is_text(row.get("name")) or not _is_text(row.get("type")) or not isinstance(row.get("content"), str):
+            die(f"Batch row {i}: name, type and content are required strings.", 2)
+        ttl = row.get("ttl")
+        if ttl is not None and not str(ttl).isdigit():
+            die(f"Batch row {i}: invalid ttl {ttl!r}", 2)
+        posts.append(build_payload(normalize_name(zone, row["name"]), row["type"].upper(),
+                                   row["content"], ttl, _parse_proxied(row.get("proxied"), i)))
+    if not posts: die("Batch input contains no records.", 2)
+    zid = resolve_zone(token, zone, zid, base)
+    for p in posts: print(f"CREATE: {p['type']} {p['name']} → {p['content']}")
+    res = apply_batch(token, zid, {"posts": posts}, yes, base)
+    cache_drop("negative.json", [_negative_key(token, base, zid, p["type"], p["name"]) for p in posts])
+    for r in res.get("posts") or []:
+        print(f"Record {r.get('name')} ({r.get('type')}) created: {r.get('content')} (ttl={r.get('ttl')} proxied={r.get('proxied')})")
 
+def cmd_delete_batch(token, zone, path, yes, base, zid=None):
+    rows = read_batch_rows(path, DELETE_BATCH_COLUMNS)
+    if not rows: die("Batch input contains no records.", 2)
+    zid = resolve_zone(token, zone, zid, base)
+    index = None
+    targets = []
+    for i, row in enumerate(rows, 1):
+        if row.get("id") is not None:
+            if not _is_text(row["id"]): die(f"Batch row {i}: id must be a non-empty string.", 2)
+            targets.append(row); continue
+        if not _is_text(row.get("name")) or not _is_text(row.get("type")):
+            die(f"Batch row {i}: provide id, or name and type (strings).", 2)
+        if row.get("content") is not None and not isinstance(row["content"], str):
+            die(f"Batch row {i}: content must be a string.", 2)
+        if index is None:
+            # One listing resolves every name/type row instead of a GET per row.
+            index = {}
+            for r in paginate_records(token, zid, base=base):
+                index.setdefault((r["type"], r["name"].lower()), []).append(r)
+        rtype, fqdn = row["type"].upper(), normalize_name(zone, row["name"])
+        matches = [r for r in index.get((rtype, fqdn.lower()), [])
+                   if row.get("content") in (None, r.get("content"))]
+        if not matches: die(f"Batch row {i}: no records match type={rtype} name={fqdn}", 3)
+        if len(matches) > 1:
+            die(f"Batch row {i}: multiple records match type={rtype} name={fqdn}. Add content or use id.", 3)
+        targets.append(matches[0])
+    for t in targets:
+        if t.get("name"): print(f"DELETE: {t.get('type')} {t.get('name')} → {t.get('content')}")
+        else: print(f"DELETE: id {t['id']}")
+    res = apply_batch(token, zid, {"deletes": [{"id": t["id"]} for t in targets]}, yes, base)
+    known = {t["id"]: t for t in targets}
+    for r in res.get("deletes") or []:
+        r = {**known.get(r.get("id"), {}), **r}
+        print(f"Record {r.get('name') or r.get('id')} ({r.get('type')}) deleted: {r.get('content')}")
+
+def _add_zones_parser(sub):
     sub.add_parser("zones", help="List all zones")
 
+def _add_list_parser(sub):
     pl = sub.add_parser("list", help="List DNS records in a zone")
     pl.add_argument("zone"); pl.add_argument("--type", dest="rtype"); pl.add_argument("--name-substr")
     pl.add_argument("--json", action="store_true")
+    pl.add_argument("--zone-id", help="Zone ID; skips the zone name lookup")
 
+def _add_add_parser(sub):
     pa = sub.add_parser("add", help="Create DNS record")
     pa.add_argument("zone"); pa.add_argument("--name", required=True)
     pa.add_argument("--type", dest="rtype", required=True)
@@ -208,25 +629,84 @@ def main():
     pa.add_argument("--ttl", type=int)
     pa.add_argument("--proxied", choices=["on","off"])
 
+def _add_update_parser(sub):
     pu = sub.add_parser("update", help="Update DNS record")
     pu.add_argument("zone"); pu.add_argument("--id", dest="rid")
+    pu.add_argument("--zone-id", help="Zone ID; skips the zone name lookup")
     pu.add_argument("--name"); pu.add_argument("--type", dest="rtype")
     pu.add_argument("--content"); pu.add_argument("--ttl", type=int)
     pu.add_argument("--proxied", choices=["on","off"])
 
+def _add_delete_parser(sub):
     pd = sub.add_parser("delete", help="Delete DNS record")
     pd.add_argument("zone"); pd.add_argument("--id", dest="rid")
+    pd.add_argument("--zone-id", help="Zone ID; skips the zone name lookup")
     pd.add_argument("--name"); pd.add_argument("--type", dest="rtype")
 
+def _add_add_batch_parser(sub):
+    pb = sub.add_parser("add-batch", help="Create many DNS records in one API call")
+    pb.add_argument("zone"); pb.add_argument("--zone-id", help="Zone ID; skips the zone name lookup")
+    pb.add_argument("--input", default="-", help="JSON array or TSV (name type content [ttl] [proxied]); default stdin")
+
+def _add_delete_batch_parser(sub):
+    pb = sub.add_parser("delete-batch", help="Delete many DNS records in one API call")
+    pb.add_argument("zone"); pb.add_argument("--zone-id", help="Zone ID; skips the zone name lookup")
+    pb.add_argument("--input", default="-", help="JSON array or TSV of ids, or `list` output; default stdin")
+
+SUBCOMMANDS = {
+    "zones": _add_zones_parser,
+    "list": _add_list_parser,
+    "add": _add_add_parser,
+    "update": _add_update_parser,
+    "delete": _add_delete_parser,
+    "add-batch": _add_add_batch_parser,
+    "delete-batch": _add_delete_batch_parser,
+}
+# Global options that consume the following argv word.
+_GLOBAL_VALUE_OPTS = ("--token-file", "--base-url")
+
+def _peek_command(argv):
+    """Return the subcommand named in argv, or None if it is missing or unknown."""
+    it = iter(argv)
+    for a in it:
+        if a in _GLOBAL_VALUE_OPTS: next(it, None)
+        elif a in ("-h", "--help"): return None
+        elif not a.startswith("-"): return a if a in SUBCOMMANDS else None
+    return None
+
+class _ParseError(Exception):
+    pass
+
+class _TrialParser(argparse.ArgumentParser):
+    """Raises instead of printing, so main() can report errors from the full tree."""
+    def error(self, message):
+        raise _ParseError(message)
+
+def build_parser(cmd=None, parser_class=argparse.ArgumentParser):
+    """Build the CLI parser; with `cmd`, only that subcommand's subparser."""
+    ap = parser_class(description="Cloudflare DNS CLI (stdlib only)", formatter_class=argparse.RawTextHelpFormatter)
+    ap.add_argument("--token-file", help="Read API token from file (first line). If omitted, uses CF_API_TOKEN.")
+    ap.add_argument("--base-url", default=API_BASE, help="Override API base URL.")
+    ap.add_argument("--yes", action="store_true", help="Skip confirmation prompts for add/update/delete.")
+    ap.add_argument("--no-cache", action="store_true", help="Bypass the on-disk cache (~/.cache/cf-dns).")
+    ap.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    for name, add_parser in SUBCOMMANDS.items():
+        if cmd is None or cmd == name: add_parser(sub)
+    return ap
+
+def main():
     if len(sys.argv) == 1:
         print("""Cloudflare DNS CLI (stdlib only)
 
 Usage:
   cf-dns.py zones
-  cf-dns.py list <zone> [--type TYPE] [--name-substr STR] [--json]
+  cf-dns.py list <zone> [--zone-id ID] [--type TYPE] [--name-substr STR] [--json]
   cf-dns.py add <zone> --name NAME --type TYPE --content VALUE [--ttl N] [--proxied on|off]
-  cf-dns.py update <zone> (--id ID | --name NAME --type TYPE) [--content VALUE] [--ttl N] [--proxied on|off]
-  cf-dns.py delete <zone> (--id ID | --name NAME --type TYPE)
+  cf-dns.py update <zone> [--zone-id ID] (--id ID | --name NAME --type TYPE) [--content VALUE] [--ttl N] [--proxied on|off]
+  cf-dns.py delete <zone> [--zone-id ID] (--id ID | --name NAME --type TYPE)
+  cf-dns.py add-batch <zone> [--zone-id ID] [--input FILE]
+  cf-dns.py delete-batch <zone> [--zone-id ID] [--input FILE]
 
 Examples:
   cf-dns.py zones | column -t
@@ -234,10 +714,22 @@ Examples:
   cf-dns.py add example.com --name www --type A --content 203.0.113.10 --ttl 300 --proxied on
   cf-dns.py update example.com --name www --type A --content 203.0.113.20
   cf-dns.py delete example.com --name www --type A
+  cf-dns.py add-batch example.com --input records.tsv
+  cf-dns.py list example.com --name-substr _acme | cf-dns.py --yes delete-batch example.com
 """)
         sys.exit(0)
 
-    args = ap.parse_args()
+    # Only build the subparser being invoked; help and parse errors get the full tree.
+    cmd = _peek_command(sys.argv[1:])
+    args = None
+    if cmd is not None:
+        try: args = build_parser(cmd, _TrialParser).parse_args()
+        except _ParseError: pass
+    if args is None:
+        args = build_parser().parse_args()
+    if args.no_cache:
+        global CACHE_ENABLED
+        CACHE_ENABLED = False
     token = read_token(args.token_file)
     base = args.base_url
 
@@ -245,7 +737,7 @@ Examples:
         cmd_zones(token, base)
     elif args.cmd == "list":
         rtype = args.rtype.upper() if args.rtype else None
-        cmd_list(token, args.zone, rtype, args.name_substr, args.json, base)
+        cmd_list(token, args.zone, rtype, args.name_substr, args.json, base, args.zone_id)
     elif args.cmd == "add":
         prox = None
         if args.proxied is not None: prox = (args.proxied.lower()=="on")
@@ -253,9 +745,13 @@ Examples:
     elif args.cmd == "update":
         prox = None
         if args.proxied is not None: prox = (args.proxied.lower()=="on")
-        cmd_update(token, args.zone, args.rid, args.name, args.rtype, args.content, args.ttl, prox, args.yes, base)
+        cmd_update(token, args.zone, args.rid, args.name, args.rtype, args.content, args.ttl, prox, args.yes, base, args.zone_id)
     elif args.cmd == "delete":
-        cmd_delete(token, args.zone, args.rid, args.name, args.rtype, args.yes, base)
+        cmd_delete(token, args.zone, args.rid, args.name, args.rtype, args.yes, base, args.zone_id)
+    elif args.cmd == "add-batch":
+        cmd_add_batch(token, args.zone, args.input, args.yes, base, args.zone_id)
+    elif args.cmd == "delete-batch":
+        cmd_delete_batch(token, args.zone, args.input, args.yes, base, args.zone_id)
 
 if __name__ == "__main__":
     main()